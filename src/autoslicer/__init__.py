@@ -1,3 +1,3 @@
-from .autoslice import AutoSlicer
+from .autoslice import AutoSlicer, Volume
 
-__all__ = ["AutoSlicer"]
\ No newline at end of file
+__all__ = ["AutoSlicer", "Volume"]
\ No newline at end of file
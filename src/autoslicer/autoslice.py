@@ -1,13 +1,258 @@
 import argparse
 import configparser
+import copy
+import functools
+import itertools
 import os
+import re
+import shutil
 import subprocess
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 import numpy as np
 from stl import Mesh
 
+try:
+    from tweaker3 import FileHandler
+    from tweaker3.MeshTweaker import Tweak
+except ImportError:
+    # Fall back to running the "tweaker3" command
+    FileHandler = Tweak = None
+
+# Flat "key = value" lines, skipping comments and blank lines
+_INI_LINE = re.compile(r"^([^=\s;#][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+# "Unprintability: 1.23" line of Tweaker-3 verbose output, may be "1e-05"
+_UNPRINTABILITY = re.compile(r"Unprintability:\s*([-+0-9.eE]+)")
+
+
+def _parse_unprintability(stdout):
+    """Get the unprintability from Tweaker-3 verbose output.
+
+    Parameters
+    ----------
+    stdout : str
+        Output of the "tweaker3" command.
+
+    Returns
+    -------
+    float
+        Worst unprintability among the parts tweaked, as they are merged by the
+        slicer.
+
+    Raises
+    ------
+    ValueError
+        If the output does not contain an unprintability.
+    """
+    matches = _UNPRINTABILITY.findall(stdout)
+    if not matches:
+        raise ValueError("Unprintability not found in Tweaker output")
+    return max(float(m) for m in matches)
+
+
+def _fast_ini_parse(text):
+    """Parse the flat "key = value" lines of a PrusaSlicer configuration file.
+
+    Parameters
+    ----------
+    text : str
+        Content of the configuration file.
+
+    Returns
+    -------
+    dict
+        Mapping of keys to (unparsed) values.
+    """
+    return dict(_INI_LINE.findall(text))
+
+
+def _resolve(path):
+    """Expand and resolve a path, caching the result.
+
+    Relative paths are cached together with the current working directory, so
+    changing directory does not return stale results. Symbolic links are not
+    followed again once cached, so paths whose link target may change (such as
+    configuration files) should be resolved without this helper.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to resolve.
+
+    Returns
+    -------
+    str
+        Absolute resolved path.
+    """
+    path = os.path.expanduser(os.fspath(path))
+    cwd = "" if os.path.isabs(path) else os.getcwd()
+    return _resolve_from(path, cwd)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_from(path, cwd):
+    """Memoized worker for `_resolve`, keyed on ``cwd`` for relative paths."""
+    return str(Path(cwd, path).resolve())
+
+
+# Binary STL: 80 bytes header, uint32 triangle count, then 50 bytes per triangle
+_STL_HEADER_SIZE = 84
+_STL_DTYPE = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("v0", "<f4", (3,)),
+        ("v1", "<f4", (3,)),
+        ("v2", "<f4", (3,)),
+        ("attr", "<u2"),
+    ]
+)
+
+
+def _fast_read_binary_stl(path):
+    """Read a binary STL file with a single read.
+
+    Avoids ``numpy.fromfile``, which is very slow on network filesystems.
+
+    Parameters
+    ----------
+    path : str
+        ".stl" file to read.
+
+    Returns
+    -------
+    header : bytes
+        Header of the file, including the triangle count.
+    count : int
+        Number of triangles.
+    triangles : numpy.ndarray or None
+        Writable array of triangles, or None if it is not a binary STL file.
+    """
+    with open(path, "rb") as stream:
+        header = stream.read(_STL_HEADER_SIZE)
+        if len(header) < _STL_HEADER_SIZE:
+            return header, 0, None
+
+        count = int(np.frombuffer(header, dtype="<u4", count=1, offset=80)[0])
+        size = count * _STL_DTYPE.itemsize
+        if count == 0 or os.fstat(stream.fileno()).st_size != _STL_HEADER_SIZE + size:
+            return header, count, None
+
+        buffer = bytearray(size)
+        stream.readinto(buffer)
+
+    return header, count, np.frombuffer(buffer, dtype=_STL_DTYPE, count=count)
+
+
+def _binary_stl_zmin_and_shift(path_in, path_out):
+    """Move a binary STL file so Zmin = 0 without going through numpy-stl.
+
+    Parameters
+    ----------
+    path_in : str
+        Binary ".stl" file to be adjusted.
+    path_out : str
+        Adjusted file path.
+
+    Returns
+    -------
+    float or None
+        Z min of the input file, or None if it is not a binary STL file (in
+        which case nothing is written).
+    """
+    header, _, triangles = _fast_read_binary_stl(path_in)
+    if triangles is None:
+        return None
+
+    vertices = ("v0", "v1", "v2")
+    zmin = min(triangles[v][:, 2].min() for v in vertices)
+    for v in vertices:
+        triangles[v][:, 2] -= zmin
+
+    with open(path_out, "wb") as stream:
+        stream.write(header)
+        # Write the shifted buffer directly, without copying the mesh again
+        stream.write(triangles.data)
+
+    return float(zmin)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path, mtime_ns, size, use_fast=True):
+    """Parse configuration file and extract a few variables.
+
+    ``mtime_ns`` and ``size`` are not used directly, they are part of the cache
+    key so that the file is parsed again whenever it changes on disk.
+
+    Parameters
+    ----------
+    path : str
+        Resolved location of printer configuration file.
+    mtime_ns : int
+        Modification time of the file, in nanoseconds.
+    size : int
+        Size of the file, in bytes.
+    use_fast : bool, default=True
+        Use a regex based parser instead of ``configparser``. Disable it for
+        profiles that rely on the full INI grammar.
+
+    Returns
+    -------
+    types.MappingProxyType
+        Parsed configuration and the variables extracted from it. The result is
+        shared by every caller, use `_copy_config` before modifying the config.
+    """
+    with open(path) as stream:
+        if use_fast:
+            config = {"top": _fast_ini_parse(stream.read())}
+        else:
+            # Read line by line, with a section header for configparser
+            config = configparser.ConfigParser()
+            config.read_file(itertools.chain(["[top]\n"], stream), source=path)
+
+    # "0x0,250x0,250x210,0x210" -> one (x, y) row per corner
+    bed_shape = np.fromstring(
+        config["top"]["bed_shape"].replace("x", ","), sep=","
+    ).reshape(-1, 2)
+    x1, y1 = bed_shape.min(axis=0).tolist()
+    x2, y2 = bed_shape.max(axis=0).tolist()
+
+    return MappingProxyType(
+        {
+            "config": config,
+            "x1": x1,
+            "x2": x2,
+            "y1": y1,
+            "y2": y2,
+            "bed_center": ((x1 + x2) / 2, (y1 + y2) / 2),
+            "filament_type": config["top"]["filament_type"],
+            "printer_model": config["top"]["printer_model"],
+            "layer_height": config["top"]["layer_height"],
+        }
+    )
+
+
+def _copy_config(config):
+    """Copy a parsed configuration, so it can be modified without side effects.
+
+    Parameters
+    ----------
+    config : dict or configparser.ConfigParser
+        Configuration parsed by `_parse_config_file`.
+
+    Returns
+    -------
+    dict or configparser.ConfigParser
+        Independent copy of ``config``.
+    """
+    if isinstance(config, configparser.ConfigParser):
+        return copy.deepcopy(config)
+    return {section: dict(values) for section, values in config.items()}
+
 
 class AutoSlicer:
     """Initialize AutoSlicer.
@@ -19,48 +264,105 @@ class AutoSlicer:
         Should be .AppImage or prusa-slicer-console.exe.
     config_path : str
         Location of printer configuration file.
+    use_fast : bool, default=True
+        Parse the configuration file with a fast regex based parser. Set to
+        False to use ``configparser`` for unusual profiles.
+    adjust_height : bool, default=False
+        Move the tweaked models so Zmin = 0 before slicing. Not needed when
+        slicing with "--merge", which already arranges the models.
     """
 
     # Select slicer parameters based on unprintability > treshold
     treshold_supports = 1.0
     treshold_brim = 2.0
 
-    def __init__(self, slicer_path, config_path):
-        self.slicer = str(Path(slicer_path).expanduser().resolve())
+    # Instances created by `from_cached`, one per class, paths and options, along
+    # with the configuration file stat they were created from
+    _instance_cache = {}
+
+    def __init__(self, slicer_path, config_path, use_fast=True, adjust_height=False):
+        self.slicer = _resolve(slicer_path)
+        self.adjust_height = adjust_height
+        self.use_fast = use_fast
         self.set_config(config_path)
 
         self.volumes = []
         self.last_output_file = ""
 
-    def set_config(self, config_path):
+    @classmethod
+    def from_cached(cls, slicer_path, config_path, use_fast=True, adjust_height=False):
+        """Create an AutoSlicer, reusing a previous one with the same settings.
+
+        Useful for batch scripts creating one AutoSlicer per file: as long as
+        the configuration file does not change, the new instance is a copy of
+        the cached one, without volumes nor output.
+
+        Parameters are the same as for `AutoSlicer`.
+
+        Returns
+        -------
+        AutoSlicer
+            New instance.
+        """
+        slicer = _resolve(slicer_path)
+        config = str(Path(config_path).expanduser().resolve())
+        stat = os.stat(config)
+        key = (cls, slicer, config, use_fast, adjust_height)
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+
+        # A changed configuration file replaces the entry instead of adding one
+        cached_stat, cached = cls._instance_cache.get(key, (None, None))
+        if cached_stat != file_stat:
+            cached = cls(slicer, config, use_fast=use_fast, adjust_height=adjust_height)
+            cls._instance_cache[key] = (file_stat, cached)
+
+        clone = copy.copy(cached)
+        clone.config = _copy_config(cached.config)
+        clone.bed_center = list(cached.bed_center)
+        clone.volumes = []
+        clone.last_output_file = ""
+        return clone
+
+    def set_config(self, config_path, use_fast=None):
         """Set configuration file for the slicer.
 
         Parameters
         ----------
         config_path : str
             Location of printer configuration file.
+        use_fast : bool, optional
+            Parse the configuration file with a fast regex based parser. Set to
+            False to use ``configparser`` for unusual profiles. Defaults to the
+            value given when creating the AutoSlicer, and is kept for later
+            calls when given.
         """
+        if use_fast is not None:
+            self.use_fast = use_fast
+
+        # Not memoized, a symlinked profile may be pointed to another file
         self.config_path = str(Path(config_path).expanduser().resolve())
         self.__config_parser()
 
     def __config_parser(self):
-        """Parse configuration file and extract a few variables."""
-        self.config = configparser.ConfigParser()
-        with open(self.config_path) as stream:
-            self.config.read_string("[top]\n" + stream.read())
-
-        bed_shape = [
-            int(i)
-            for x in self.config["top"]["bed_shape"].split(",")
-            for i in x.split("x")
-        ]
-        self.x1, self.x2 = list(set(bed_shape[::2]))
-        self.y1, self.y2 = list(set(bed_shape[1::2]))
-        self.bed_center = [(self.x1 + self.x2) / 2, (self.y1 + self.y2) / 2]
+        """Parse configuration file and extract a few variables.
+
+        Parsed files are cached by path, modification time and size, so
+        repeated calls with an unchanged file do not parse it again. Each
+        instance gets its own copy of the config.
+        """
+        stat = os.stat(self.config_path)
+        parsed = _parse_config_file(
+            self.config_path, stat.st_mtime_ns, stat.st_size, self.use_fast
+        )
+
+        self.config = _copy_config(parsed["config"])
+        self.x1, self.x2 = parsed["x1"], parsed["x2"]
+        self.y1, self.y2 = parsed["y1"], parsed["y2"]
+        self.bed_center = list(parsed["bed_center"])
 
-        self.filament_type = self.config["top"]["filament_type"]
-        self.printer_model = self.config["top"]["printer_model"]
-        self.layer_height = self.config["top"]["layer_height"]
+        self.filament_type = parsed["filament_type"]
+        self.printer_model = parsed["printer_model"]
+        self.layer_height = parsed["layer_height"]
 
     def __tweakFile(self, input_file, tmpdir):
         """Run Tweaker.py from https://github.com/ChristophSchranz/Tweaker-3
@@ -79,26 +381,68 @@ class AutoSlicer:
         unprintability : float
             Measure of the "printability" of the file. Lower is better.
         """
-        try:
-            output_file = os.path.join(tmpdir, "tweaked.stl")
-            curr_path = os.path.dirname(os.path.abspath(__file__))
+        output_file = os.path.join(tmpdir, "tweaked.stl")
+        if Tweak is not None:
+            unprintability = self.__tweakInProcess(input_file, output_file)
+            if unprintability is not None:
+                return output_file, unprintability
 
-            cmd = ["tweaker3"]
+        result = ""
+        try:
+            cmd = [shutil.which("tweaker3") or "tweaker3"]
             cmd += ["-i", input_file, "-o", output_file]
             cmd += ["-x", "-vb"]
 
             # Run command
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            result = result.stdout
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True)
+            result = result.stdout.decode(errors="replace")
 
             # Get "unprintability" from stdout
-            _, temp = result.splitlines()[-5].split(":")
-            unprintability = str(round(float(temp.strip()), 2))
+            unprintability = _parse_unprintability(result)
 
             return output_file, unprintability
         except Exception:
             print("Couldn't run tweaker on file " + input_file, result)
 
+    def __tweakInProcess(self, input_file, output_file):
+        """Run Tweaker-3 as a Python module, without spawning a process.
+
+        Parameters
+        ----------
+        input_file : str
+            Input ".stl" file.
+        output_file : str
+            Tweaked file path.
+
+        Returns
+        -------
+        unprintability : float or None
+            Measure of the "printability" of the file. Lower is better. None if
+            tweaking failed.
+        """
+        try:
+            file_handler = FileHandler.FileHandler()
+            objs = file_handler.load_mesh(input_file)
+
+            info = {}
+            for part, content in objs.items():
+                tweak = Tweak(content["mesh"], extended_mode=True, verbose=False)
+                info[part] = {"matrix": tweak.matrix, "tweaker_stats": tweak}
+
+            file_handler.write_mesh(objs, info, output_file, "binarystl")
+
+            # Several parts are merged by the slicer, keep the worst one
+            unprintability = max(
+                i["tweaker_stats"].unprintability for i in info.values()
+            )
+            return float(unprintability)
+        except Exception as e:
+            print(
+                f"Couldn't run tweaker module on file {input_file} ({e}),"
+                " falling back to the tweaker3 command"
+            )
+            return None
+
     def __adjustHeight(self, input_file, tmpdir):
         """Move STL coordinates so Zmin = 0.
 
@@ -121,46 +465,59 @@ class AutoSlicer:
         # Move STL coordinates so Zmin = 0
         # This avoids errors in PrusaSlicer if Z is above/below the build plate
         try:
-            output_file = Path(os.path.join(tmpdir, "translated_1.stl"))
-            i = 1
-            while output_file.exists():
-                output_file = Path(os.path.join(tmpdir, f"translated_{i}.stl"))
-                i += 1
+            # Each volume works in its own directory, so the name is unique
+            output_file = Path(os.path.join(tmpdir, "translated.stl"))
+
+            if _binary_stl_zmin_and_shift(input_file, str(output_file)) is not None:
+                return str(output_file)
 
+            # ASCII STL, load the whole mesh
             my_mesh = Mesh.from_file(input_file)
 
-            translation = np.array([0, 0, -my_mesh.z.min()])
-            my_mesh.translate(translation)
-            print("Translated, new Z min:", my_mesh.z.min())
+            # Only Z is shifted, so subtract in place on the Z view instead of
+            # translating all coordinates
+            z = my_mesh.z
+            zmin = z.min()
+            if z.flags.writeable and np.shares_memory(z, my_mesh.data):
+                np.subtract(z, zmin, out=z)
+            else:
+                my_mesh.translate(np.array([0, 0, -zmin]))
+            print("Translated, old Z min:", zmin)
             my_mesh.save(output_file)
             return str(output_file)
         except:
             print("Couldn't adjust height of file " + input_file)
 
-    def __parse_kwargs(self, *args, **kwargs):
+    def __parse_kwargs(self, **kwargs):
         """Parse arguments from kwargs to command line as:
 
-        __parse_kwargs(a=1) -> ["--a", 1]
+        __parse_kwargs(a=1) -> ["--a", "1"]
 
         Returns
         -------
         list
             List of commands.
         """
-        extended_cmd = []
-        for key, value in kwargs.items():
-            key = key.replace("_", "-")
-            extended_cmd += [f"--{key}", value]
-        return extended_cmd
+        return [
+            item
+            for key, value in kwargs.items()
+            for item in (f"--{key.replace('_', '-')}", str(value))
+        ]
 
-    def __runSlicer(self, output_path, **kwargs):
+    def __runSlicer(self, output_path, quiet=False, **kwargs):
         """Run PrusaSlicer
 
         Parameters
         ----------
         output_path : str
             File to slice.
+        quiet : bool, default=False
+            Discard PrusaSlicer output instead of printing it.
         """
+        # Cleared until the new file is found, so a failure does not leave the
+        # previous output behind
+        self.last_output_file = ""
+
         # Run PrusaSlicer
         # Form command to run
         # Example: prusa-slicer-console.exe --load MK3Sconfig.ini -g -o outputFiles/sliced.gcode inputFiles/input.gcode
@@ -172,19 +529,19 @@ class AutoSlicer:
             v_args = [v.tmp_path] + v.args
             cmd.extend(v_args)
 
-        unprintability = max([float(v.unprintability) for v in self.volumes])
-        print("Unprintability: " + f"{unprintability}")
+        unprintability = max(v.unprintability for v in self.volumes)
+        print(f"Unprintability: {unprintability:.2f}")
 
-        output_path = Path(output_path).expanduser().resolve()
+        output_path = Path(_resolve(output_path))
         output_name = output_path.stem + f"_{self.layer_height}mm"
-        output_name += f"_U{unprintability}" + "_{print_time}"
+        output_name += f"_U{unprintability:.2f}" + "_{print_time}"
         output_name += f"_{self.filament_type}_{self.printer_model}.gcode"
 
         output_file = str(output_path.with_name(output_name))
 
-        if float(unprintability) > self.treshold_brim:
+        if unprintability > self.treshold_brim:
             cmd.extend(["--brim-width", "5", "--skirt-distance", "6"])
-        if float(unprintability) > self.treshold_supports:
+        if unprintability > self.treshold_supports:
             cmd.append("--support-material")
 
         extended_arguments = self.__parse_kwargs(**kwargs)
@@ -195,14 +552,54 @@ class AutoSlicer:
 
         print(cmd)
         try:
-            subprocess.run(cmd)
-            self.last_output_file = max(
-                Path(output_file).parent.glob("*.gcode"), key=os.path.getctime
+            result = subprocess.run(
+                cmd,
+                check=False,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL if quiet else None,
             )
+            if result.returncode != 0:
+                print(f"PrusaSlicer exited with code {result.returncode}")
+                return
+            # "{print_time}" is filled in by PrusaSlicer, so look for the most
+            # recent file matching the rest of the name
+            prefix = output_name.split("{print_time}")[0]
+            with os.scandir(output_path.parent) as entries:
+                self.last_output_file = max(
+                    (
+                        e
+                        for e in entries
+                        if e.name.startswith(prefix) and e.name.endswith(".gcode")
+                    ),
+                    key=lambda e: e.stat().st_ctime_ns,
+                ).path
         except Exception:
             print(["Couldn't slice volumes "] + [v.path for v in self.volumes])
 
-    def slice(self, output, view_output=False, **kwargs):
+    def _prepare_volume(self, volume, tmpdir):
+        """Tweak and, if enabled, adjust the height of a single volume.
+
+        Parameters
+        ----------
+        volume : Volume
+            Volume to be prepared.
+        tmpdir : str
+            Temporary directory where to work on. Must not be shared with other
+            volumes, as intermediate files have fixed names.
+
+        Returns
+        -------
+        tmp_path : str
+            Path of the prepared file.
+        unprintability : float
+            Measure of the "printability" of the file. Lower is better.
+        """
+        tmp_path, unprintability = self.__tweakFile(volume.path, tmpdir)
+        if self.adjust_height:
+            tmp_path = self.__adjustHeight(tmp_path, tmpdir)
+        return tmp_path, unprintability
+
+    def slice(self, output, view_output=False, quiet=False, **kwargs):
         """Rotate and slice file in optimal orientation.
 
         Parameters
@@ -210,16 +607,76 @@ class AutoSlicer:
         output : str
             Output path for the ".gcode". Note that the filename will be appended
             with informations about the print (printing time, printer model, etc.).
+        view_output : bool, default=False
+            Open the sliced file on PrusaSlicer viewer.
+        quiet : bool, default=False
+            Discard PrusaSlicer output instead of printing it. Errors are still
+            printed.
         """
         with tempfile.TemporaryDirectory() as temp_directory:
-            for v in self.volumes:
-                v.tmp_path, v.unprintability = self.__tweakFile(v.path, temp_directory)
-                v.tmp_path = self.__adjustHeight(v.tmp_path, temp_directory)
+            # Each volume gets its own subdirectory so that workers do not
+            # collide on intermediate file names
+            volume_dirs = []
+            for idx in range(len(self.volumes)):
+                volume_dir = os.path.join(temp_directory, f"v{idx}")
+                os.mkdir(volume_dir)
+                volume_dirs.append(volume_dir)
+
+            # Tweaking and adjusting are independent for each volume and mostly
+            # spent waiting on subprocesses and disk I/O, so run them in threads
+            max_workers = max(1, min(len(self.volumes), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(self._prepare_volume, self.volumes, volume_dirs)
+                )
+
+            for v, (tmp_path, unprintability) in zip(self.volumes, results):
+                v.tmp_path, v.unprintability = tmp_path, unprintability
+
+            self.__runSlicer(output, quiet=quiet, **kwargs)
+
+        if view_output and self.last_output_file:
+            self.view_gcode(self.last_output_file)
 
-            self.__runSlicer(output, **kwargs)
+    def slice_batch(self, outputs, quiet=False, **kwargs):
+        """Slice several sets of models, each into its own ".gcode".
 
-        if view_output:
-            self.view_gcode(self.last_output_file)
+        PrusaSlicer can only merge the models of one output per run, so it is
+        run once per output. The volumes added with `add_volume` are left
+        untouched.
+
+        Parameters
+        ----------
+        outputs : list of (str, list)
+            Pairs of output path for the ".gcode" and models to slice into it.
+            Each model is either a `Volume`, a ``(path, kwargs)`` pair with the
+            same arguments as `add_volume`, or just a path (.stl or .mf3).
+        quiet : bool, default=False
+            Discard PrusaSlicer output instead of printing it.
+
+        Returns
+        -------
+        list
+            Path of the sliced file for each output, or None if slicing failed.
+        """
+        volumes = self.volumes
+        output_files = []
+        try:
+            for output, inputs in outputs:
+                self.volumes = []
+                for input in inputs:
+                    if isinstance(input, Volume):
+                        self.volumes.append(input)
+                    elif isinstance(input, tuple):
+                        path, volume_kwargs = input
+                        self.add_volume(path, **volume_kwargs)
+                    else:
+                        self.add_volume(input)
+                self.slice(output, quiet=quiet, **kwargs)
+                output_files.append(self.last_output_file or None)
+        finally:
+            self.volumes = volumes
+        return output_files
 
     def insert_pause_print(self, z, comment=None):
         if comment is None:
@@ -263,15 +720,13 @@ class AutoSlicer:
             If argument cannot be casted to pathlib.Path.
         """
         try:
-            input = Path(input)
+            input_file = _resolve(input)
         except TypeError as e:
             raise TypeError(
                 "input argument must be a pathlib.Path (or a type that supports"
                 " casting to pathlib.Path, such as string)."
             ) from e
 
-        input_file = str(input.expanduser().resolve())
-
         new_volume = Volume(input_file)
         new_volume.args = self.__parse_kwargs(**kwargs)
 
@@ -288,24 +743,45 @@ class AutoSlicer:
         cmd = [self.slicer, "--gcodeviewer", gcode_path]
         subprocess.run(cmd)
 
-    def help(self):
+    def help(self, stream=False, file=None):
         """Print "--help-options".
 
+        Parameters
+        ----------
+        stream : bool, default=False
+            Write the output line by line to ``file`` instead of capturing it.
+        file : file-like, optional
+            Where to write the output when streaming. Defaults to sys.stdout.
+
         Returns
         -------
-        list
-            List with the output of the command run.
+        subprocess.CompletedProcess or int
+            The captured output of the command run, or its return code when
+            streaming.
         """
         cmd = [self.slicer, "--help-options"]
-        return subprocess.run(cmd, capture_output=True, text=True)
+        if not stream:
+            return subprocess.run(cmd, capture_output=True, text=True)
+
+        file = sys.stdout if file is None else file
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ) as process:
+            for line in process.stdout:
+                file.write(line)
+        return process.returncode
 
 
 class Volume:
     """Container for the models to be sliced by AutoSlicer."""
 
-    def __init__(self, input_path, args=""):
+    def __init__(self, input_path, args=None):
         self.path = input_path
-        self.args = args
+        self.args = [] if args is None else args
         self.tmp_path = ""
 
 
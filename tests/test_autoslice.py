@@ -0,0 +1,111 @@
+import configparser
+import os
+
+import numpy as np
+import pytest
+from stl import Mesh, Mode
+
+from autoslicer.autoslice import (
+    _binary_stl_zmin_and_shift,
+    _fast_ini_parse,
+    _parse_config_file,
+    _parse_unprintability,
+)
+
+PROFILE = """# generated by PrusaSlicer 2.6.0 on 2023-06-01 at 12:00:00 UTC
+bed_shape = 250x0,0x0,0x210,250x210
+filament_type = PLA
+printer_model = MK3S
+layer_height = 0.2
+
+end_gcode = G1 X0 Y200 ; present print
+fill_pattern=gyroid
+notes =
+start_gcode = M115 U3.9.0 ; tell printer latest fw version\\nG28 W
+"""
+
+
+def _parse_profile(tmp_path, use_fast):
+    path = tmp_path / "config.ini"
+    path.write_text(PROFILE)
+    stat = os.stat(path)
+    return _parse_config_file(str(path), stat.st_mtime_ns, stat.st_size, use_fast)
+
+
+def _make_mesh(n=100):
+    rng = np.random.default_rng(0)
+    data = np.zeros(n, dtype=Mesh.dtype)
+    data["vectors"] = rng.random((n, 3, 3), dtype=np.float32) * 10 + 5
+    data["attr"] = np.arange(n).reshape(-1, 1)
+    return Mesh(data)
+
+
+@pytest.mark.parametrize("use_fast", [True, False])
+def test_parse_config_file_bed_shape_order(tmp_path, use_fast):
+    parsed = _parse_profile(tmp_path, use_fast)
+    assert (parsed["x1"], parsed["x2"]) == (0, 250)
+    assert (parsed["y1"], parsed["y2"]) == (0, 210)
+    assert parsed["bed_center"] == (125, 105)
+
+
+def test_fast_ini_parse_matches_configparser(tmp_path):
+    config = configparser.ConfigParser()
+    config.read_string("[top]\n" + PROFILE)
+    assert _fast_ini_parse(PROFILE) == dict(config["top"])
+
+    fast = _parse_profile(tmp_path, use_fast=True)
+    slow = _parse_profile(tmp_path, use_fast=False)
+    for key in fast:
+        if key != "config":
+            assert fast[key] == slow[key]
+
+
+def test_binary_stl_zmin_and_shift(tmp_path):
+    path_in, path_out = tmp_path / "in.stl", tmp_path / "out.stl"
+    mesh = _make_mesh()
+    mesh.save(str(path_in), mode=Mode.BINARY)
+
+    zmin = _binary_stl_zmin_and_shift(str(path_in), str(path_out))
+    assert zmin == pytest.approx(float(mesh.z.min()))
+
+    mesh.translate(np.array([0, 0, -zmin]))
+    shifted = Mesh.from_file(str(path_out))
+    np.testing.assert_allclose(shifted.vectors, mesh.vectors, atol=1e-5)
+    np.testing.assert_array_equal(shifted.attr, mesh.attr)
+    assert path_out.read_bytes()[:84] == path_in.read_bytes()[:84]
+
+
+def test_binary_stl_zmin_and_shift_not_binary(tmp_path):
+    path_in, path_out = tmp_path / "in.stl", tmp_path / "out.stl"
+    mesh = _make_mesh()
+
+    mesh.save(str(path_in), mode=Mode.ASCII)
+    assert _binary_stl_zmin_and_shift(str(path_in), str(path_out)) is None
+
+    mesh.save(str(path_in), mode=Mode.BINARY)
+    path_in.write_bytes(path_in.read_bytes()[:-10])
+    assert _binary_stl_zmin_and_shift(str(path_in), str(path_out)) is None
+    assert not path_out.exists()
+
+
+def test_parse_unprintability():
+    stdout = "Result-stats:\n  Unprintability: 2.345\n  Elapsed time: 0.1s\n"
+    assert _parse_unprintability(stdout) == 2.345
+
+
+def test_parse_unprintability_scientific_notation():
+    assert _parse_unprintability("Unprintability: 1e-05\n") == 1e-05
+
+
+def test_parse_unprintability_worst_part():
+    stdout = "Unprintability: 3.0\nUnprintability: 0.5\n"
+    assert _parse_unprintability(stdout) == 3.0
+
+
+def test_parse_unprintability_trailing_punctuation():
+    assert _parse_unprintability("Unprintability: 1.5, done\n") == 1.5
+
+
+def test_parse_unprintability_missing():
+    with pytest.raises(ValueError):
+        _parse_unprintability("Couldn't load file\n")